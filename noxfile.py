@@ -14,8 +14,8 @@ LOCATIONS = [PACKAGE, "tests", "noxfile.py"]
 @nox.session(python=PYTHON_VERSIONS)
 def tests(session):
     """Run the test suite with coverage."""
-    session.install(".", "pytest>=7.4.0", "pytest-cov>=4.1.0")
-    session.run("pytest", "--cov")
+    session.install(".", "pytest>=7.4.0", "pytest-cov>=4.1.0", "pytest-xdist>=3.3.0")
+    session.run("pytest", "--cov", "-n", "auto")
 
 
 @nox.session(python=DEFAULT_PYTHON)